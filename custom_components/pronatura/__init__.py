@@ -2,22 +2,25 @@
 
 from __future__ import annotations
 
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import translation as translation_helper
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import ProNaturaApiClient
-from .const import DOMAIN, PLATFORMS
+from .const import DATA_CLIENT, DOMAIN, PLATFORMS
 from .coordinator import ProNaturaDataUpdateCoordinator
-from .models import ProNaturaConfigEntry, ProNaturaRuntimeData
+from .models import (
+    ProNaturaAddressDefaults,
+    ProNaturaConfigEntry,
+    ProNaturaRuntimeData,
+)
+from .util import async_get_api_client
 
 type ConfigEntryType = ProNaturaConfigEntry
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntryType) -> bool:
     """Set up ProNatura from a config entry."""
-    session = async_get_clientsession(hass)
-    client = ProNaturaApiClient(session)
+    client = async_get_api_client(hass)
 
     await translation_helper.async_load_integrations(hass, {DOMAIN})
 
@@ -31,6 +34,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntryType) -> bool
     entry.runtime_data = ProNaturaRuntimeData(
         client=client,
         coordinator=coordinator,
+        defaults=ProNaturaAddressDefaults.from_entry_data(entry.data),
     )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -42,4 +46,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntryType) -> boo
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         entry.runtime_data = None  # type: ignore[assignment]
+        if not any(
+            other.entry_id != entry.entry_id
+            and other.state is ConfigEntryState.LOADED
+            for other in hass.config_entries.async_entries(DOMAIN)
+        ):
+            hass.data.get(DOMAIN, {}).pop(DATA_CLIENT, None)
     return unload_ok
@@ -6,11 +6,16 @@
 
 Street and address identifiers are intentionally treated as dynamic: I found, that
 the IDs change over time preventing already created sensors to update.
-As a result, every schedule lookup re-fetches the street list, then the address points for the
+As a result, every schedule lookup resolves the street list, then the address points for the
 matching street, and only then calls the trash-schedule endpoint with the
 current address identifier. This flow ensures we always find the correct
 collection plan even if the upstream IDs change between requests.
 
+Non-empty street and address point lists are kept for `LOOKUP_CACHE_TTL`. When
+a lookup or the schedule request fails after cached lists were used, the cache is
+dropped and the lookup retried once with fresh data, so changed IDs are still
+picked up.
+
 Therefore HA sensors looks by street name, building number, and optionally
 address name to identify the correct address - not the address_id.
 
@@ -18,26 +23,66 @@ Building number is not always a number - sometimes it's a name, like PARKING.
 
 Each request shares a Home Assistant managed `ClientSession`, respects
 `API_TIMEOUT`, and raises `ProNaturaApiError` subclasses for consistent
-error handling across the integration layers.
+error handling across the integration layers. Timeouts, connection errors and
+429/5xx responses are retried up to `API_RETRY_ATTEMPTS` times with jittered
+exponential back-off, honoring `Retry-After` when the server sends it.
 """
 
 from __future__ import annotations
 
-from asyncio import timeout
+from asyncio import gather, sleep, timeout
+from functools import lru_cache
+from http import HTTPStatus
 import logging
+import random
+import time
 from typing import Any, TypedDict
 
-from aiohttp import ClientError, ClientResponse, ClientSession
+from aiohttp import ClientError, ClientResponse, ClientSession, hdrs
+
+from homeassistant.util.json import json_loads
 
-from .const import API_TIMEOUT, BASE_API_URL
+from .const import (
+    API_RETRY_ATTEMPTS,
+    API_RETRY_BACKOFF,
+    API_RETRY_MAX_DELAY,
+    API_TIMEOUT,
+    BASE_API_URL,
+    LOOKUP_CACHE_TTL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_STREETS_URL = f"{BASE_API_URL}/streets"
+_ADDRESS_POINTS_URL = f"{BASE_API_URL}/address-points/"
+_REQUEST_HEADERS = {
+    hdrs.ACCEPT: "application/json",
+}
+
+_RETRYABLE_STATUSES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
 
 class ProNaturaApiError(Exception):
     """Raised when the ProNatura API request fails."""
 
 
+class ProNaturaTransientError(ProNaturaApiError):
+    """Raised when a request failed in a way that is worth retrying."""
+
+    def __init__(self, message: str, *, retry_after: float | None = None) -> None:
+        """Store the delay requested by the server, if any."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class ProNaturaLookupError(ProNaturaApiError):
     """Base class for lookup related errors."""
 
@@ -100,21 +145,54 @@ class ProNaturaApiClient:
     def __init__(self, session: ClientSession) -> None:
         """Initialize the API client."""
         self._session = session
-
-    async def async_get_streets(self) -> list[ProNaturaStreet]:
-        """Return all streets."""
+        self._streets_cache: tuple[float, list[ProNaturaStreet]] | None = None
+        self._street_index: (
+            tuple[list[ProNaturaStreet], dict[str, tuple[str, str]]] | None
+        ) = None
+        self._address_points_cache: dict[
+            str, tuple[float, list[ProNaturaAddressPoint]]
+        ] = {}
+        self._validators: dict[str, tuple[str | None, str | None, Any]] = {}
+
+    def invalidate_lookup_cache(self) -> None:
+        """Drop cached street and address point lists and their validators."""
+        self._streets_cache = None
+        self._street_index = None
+        self._address_points_cache.clear()
+        for url in [url for url in self._validators if _is_lookup_url(url)]:
+            del self._validators[url]
+        _normalize_cached_text.cache_clear()
+        _normalize_cached_building_number.cache_clear()
+
+    async def async_get_streets(
+        self, *, use_cache: bool = True
+    ) -> list[ProNaturaStreet]:
+        """Return all streets, refreshing the cache when `use_cache` is False."""
+        cached = self._streets_cache if use_cache else None
+        if cached is not None and _is_fresh(cached[0]):
+            _LOGGER.debug("Using cached ProNatura streets list")
+            return cached[1]
         _LOGGER.debug("Requesting ProNatura streets list")
         response: list[ProNaturaStreet] = await self._request(
             "streets", context="streets list"
         )
         _LOGGER.debug("Received %d ProNatura streets", len(response))
+        self._streets_cache = (time.monotonic(), response) if response else None
         return response
 
     async def async_get_address_points(
-        self, street_id: str, *, street_name: str | None = None
+        self, street_id: str, *, street_name: str | None = None, use_cache: bool = True
     ) -> list[ProNaturaAddressPoint]:
-        """Return address points for a street."""
+        """Return address points for a street, refreshing the cache if asked to."""
         target = street_name or street_id
+        cached = self._address_points_cache.get(street_id) if use_cache else None
+        if cached is not None and _is_fresh(cached[0]):
+            _LOGGER.debug(
+                "Using cached ProNatura address points for street %s (id: %s)",
+                target,
+                street_id,
+            )
+            return cached[1]
         _LOGGER.debug(
             "Requesting ProNatura address points for street %s (id: %s)",
             target,
@@ -130,6 +208,10 @@ class ProNaturaApiClient:
             target,
             street_id,
         )
+        if response:
+            self._address_points_cache[street_id] = (time.monotonic(), response)
+        else:
+            self._address_points_cache.pop(street_id, None)
         return response
 
     async def async_get_trash_schedule(
@@ -149,77 +231,213 @@ class ProNaturaApiClient:
         )
         return response
 
-    async def async_get_trash_schedule_for_address(
+    async def async_get_trash_schedule_for_normalized_address(
         self,
         *,
-        street_name: str,
-        building_number: str | None,
-        address_name: str | None = None,
+        street: str,
+        building_number: str,
+        address_name: str = "",
         label: str | None = None,
-    ) -> ProNaturaTrashScheduleResponse:
-        """Resolve the current address identifier before fetching the schedule."""
-        if not (
-            _normalize_text(street_name) and _normalize_building_number(building_number)
-        ):
+        street_id: str | None = None,
+    ) -> tuple[ProNaturaTrashScheduleResponse, str]:
+        """Resolve an address from already normalized lookup keys.
+
+        `street_id` is the last known identifier of the street. When given, its
+        address points are requested together with the street list and used
+        only if the identifier is still current. Returns the schedule and the
+        current street identifier, to be passed as `street_id` next time.
+        """
+        if not (street and building_number):
             raise ProNaturaApiError("Missing data required to resolve address")
 
-        if not (_streets := await self.async_get_streets()):
+        used_cache = self._has_cached_lookups()
+        try:
+            return await self._async_resolve_trash_schedule(
+                street=street,
+                building_number=building_number,
+                address_name=address_name,
+                label=label,
+                street_id=street_id,
+            )
+        except ProNaturaTransientError:
+            raise
+        except ProNaturaApiError as err:
+            if not used_cache:
+                raise
+            _LOGGER.debug(
+                "Lookup failed for %s (%s); retrying with fresh street data",
+                label or street,
+                err,
+            )
+            self.invalidate_lookup_cache()
+            return await self._async_resolve_trash_schedule(
+                street=street,
+                building_number=building_number,
+                address_name=address_name,
+                label=label,
+                street_id=street_id,
+            )
+
+    async def _async_resolve_trash_schedule(
+        self,
+        *,
+        street: str,
+        building_number: str,
+        address_name: str,
+        label: str | None,
+        street_id: str | None,
+    ) -> tuple[ProNaturaTrashScheduleResponse, str]:
+        """Look up the address identifier and fetch its schedule."""
+        prefetched: list[ProNaturaAddressPoint] | None = None
+        if street_id is None:
+            _streets = await self.async_get_streets()
+        else:
+            _streets, prefetched = await gather(
+                self.async_get_streets(),
+                self._async_prefetch_address_points(street_id, street),
+            )
+
+        if not _streets:
             raise ProNaturaApiError("No streets returned by ProNatura")
 
-        street_id: str | None = None
-        normalized_street = _normalize_text(street_name)
-        for street in _streets:
-            if _normalize_text(street["street"]) == normalized_street:
-                street_id = street["id"]
-                break
-
-        if street_id is None:
+        if (match := self._get_street_index(_streets).get(street)) is None:
             raise ProNaturaStreetNotFoundError("Street not found")
-
-        addresses = await self.async_get_address_points(
-            street_id, street_name=street_name
-        )
-        normalized_number = _normalize_building_number(building_number)
-        normalized_name = _normalize_text(address_name)
-
-        for address in addresses:
-            if (
-                _normalize_building_number(address["buildingNumber"])
-                != normalized_number
-            ):
-                continue
-            if (
-                normalized_name
-                and _normalize_text(address.get("name")) != normalized_name
-            ):
-                continue
-            return await self.async_get_trash_schedule(address["id"], label=label)
-
-        raise ProNaturaAddressNotFoundError("Address not found")
+        current_street_id, current_street_name = match
+
+        if prefetched is not None and current_street_id == street_id:
+            addresses = prefetched
+        else:
+            addresses = await self.async_get_address_points(
+                current_street_id, street_name=current_street_name
+            )
+
+        address_id: str | None
+        if address_name:
+            address_id = _index_addresses(addresses).get(
+                (building_number, address_name)
+            )
+        else:
+            # Without a name any address point with a matching number will do.
+            address_id = next(
+                (
+                    item["id"]
+                    for item in addresses
+                    if normalize_building_number(item["buildingNumber"])
+                    == building_number
+                ),
+                None,
+            )
+
+        if address_id is None:
+            raise ProNaturaAddressNotFoundError("Address not found")
+        schedule = await self.async_get_trash_schedule(address_id, label=label)
+        return schedule, current_street_id
+
+    def _has_cached_lookups(self) -> bool:
+        """Return True if a lookup may be served from cached lists."""
+        if (cached := self._streets_cache) is not None and _is_fresh(cached[0]):
+            return True
+        return any(_is_fresh(ts) for ts, _ in self._address_points_cache.values())
+
+    def _get_street_index(
+        self, streets: list[ProNaturaStreet]
+    ) -> dict[str, tuple[str, str]]:
+        """Return the name index for a street list, reusing it for the same list."""
+        if (cached := self._street_index) is None or cached[0] is not streets:
+            cached = self._street_index = (streets, _index_streets(streets))
+        return cached[1]
+
+    async def _async_prefetch_address_points(
+        self, street_id: str, street_name: str
+    ) -> list[ProNaturaAddressPoint] | None:
+        """Return address points for a possibly stale street id, or None on failure."""
+        try:
+            return await self.async_get_address_points(
+                street_id, street_name=street_name
+            )
+        except ProNaturaApiError as err:
+            _LOGGER.debug(
+                "Prefetching address points for street %s (id: %s) failed: %s",
+                street_name,
+                street_id,
+                err,
+            )
+            return None
 
     async def _request(self, path: str, *, context: str | None = None) -> Any:
-        """Perform an HTTP GET request."""
+        """Perform an HTTP GET request, retrying transient failures."""
         url = f"{BASE_API_URL}/{path}"
         readable_target = context or url
+        # The final attempt runs outside the loop, so its error always propagates.
+        for attempt in range(1, API_RETRY_ATTEMPTS):
+            try:
+                return await self._request_once(url, readable_target)
+            except ProNaturaTransientError as err:
+                delay = err.retry_after
+                if delay is None:
+                    delay = API_RETRY_BACKOFF * 2 ** (attempt - 1)
+                    delay += random.uniform(0, 0.1)
+                delay = min(delay, API_RETRY_MAX_DELAY)
+                _LOGGER.debug(
+                    "Retrying %s in %.2f s after attempt %d failed: %s",
+                    readable_target,
+                    delay,
+                    attempt,
+                    err,
+                )
+                await sleep(delay)
+        try:
+            return await self._request_once(url, readable_target)
+        except ProNaturaTransientError as err:
+            _LOGGER.warning(
+                "Giving up on %s after %d attempts: %s",
+                readable_target,
+                API_RETRY_ATTEMPTS,
+                err,
+            )
+            raise
+
+    async def _request_once(self, url: str, readable_target: str) -> Any:
+        """Perform a single HTTP GET request."""
+        headers = dict(_REQUEST_HEADERS)
+        if (validator := self._validators.get(url)) is not None:
+            etag, last_modified, _ = validator
+            if etag:
+                headers[hdrs.IF_NONE_MATCH] = etag
+            if last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = last_modified
         _LOGGER.debug("Sending GET request to %s", readable_target)
         try:
             async with timeout(API_TIMEOUT):
-                async with self._session.get(url) as response:
+                async with self._session.get(url, headers=headers) as response:
                     _LOGGER.debug(
                         "ProNatura response status %s for %s",
                         response.status,
                         readable_target,
                     )
+                    if response.status == HTTPStatus.NOT_MODIFIED and validator:
+                        _LOGGER.debug(
+                            "Reusing unchanged payload from %s", readable_target
+                        )
+                        return validator[2]
                     await _raise_for_status(response, context=readable_target)
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
                     _LOGGER.debug("Decoded JSON payload from %s", readable_target)
+                    etag = response.headers.get(hdrs.ETAG)
+                    last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+                    if etag or last_modified:
+                        self._validators[url] = (etag, last_modified, data)
+                    else:
+                        self._validators.pop(url, None)
                     return data
         except TimeoutError as err:
-            _LOGGER.warning("Timed out while fetching %s", readable_target)
-            raise ProNaturaApiError("Timed out while connecting to ProNatura") from err
+            _LOGGER.debug("Timed out while fetching %s", readable_target)
+            raise ProNaturaTransientError(
+                "Timed out while connecting to ProNatura"
+            ) from err
         except ClientError as err:
-            _LOGGER.warning("Client error while fetching %s: %s", readable_target, err)
-            raise ProNaturaApiError("Error communicating with ProNatura") from err
+            _LOGGER.debug("Client error while fetching %s: %s", readable_target, err)
+            raise ProNaturaTransientError("Error communicating with ProNatura") from err
 
 
 async def _raise_for_status(
@@ -240,18 +458,78 @@ async def _raise_for_status(
         response.status,
         text,
     )
-    raise ProNaturaApiError(
-        f"Request failed with status {response.status}: {text or 'unknown error'}"
-    )
+    message = f"Request failed with status {response.status}: {text or 'unknown error'}"
+    if response.status in _RETRYABLE_STATUSES:
+        raise ProNaturaTransientError(
+            message, retry_after=_parse_retry_after(response)
+        )
+    raise ProNaturaApiError(message)
 
 
-def _normalize_text(value: str | None) -> str:
+def _parse_retry_after(response: ClientResponse) -> float | None:
+    """Return the Retry-After delay in seconds, if given as a number."""
+    if (value := response.headers.get(hdrs.RETRY_AFTER)) is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+def _is_lookup_url(url: str) -> bool:
+    """Return True for the street and address point list endpoints."""
+    return url == _STREETS_URL or url.startswith(_ADDRESS_POINTS_URL)
+
+
+def _is_fresh(timestamp: float) -> bool:
+    """Return True while a cached lookup is younger than the cache TTL."""
+    return time.monotonic() - timestamp < LOOKUP_CACHE_TTL.total_seconds()
+
+
+def _index_streets(streets: list[ProNaturaStreet]) -> dict[str, tuple[str, str]]:
+    """Return (id, name) pairs keyed by normalized street name, first match wins."""
+    index: dict[str, tuple[str, str]] = {}
+    for street in streets:
+        name = street["street"]
+        index.setdefault(normalize_text(name), (street["id"], name))
+    return index
+
+
+def _index_addresses(
+    addresses: list[ProNaturaAddressPoint],
+) -> dict[tuple[str, str], str]:
+    """Return address point ids keyed by normalized building number and name."""
+    index: dict[tuple[str, str], str] = {}
+    for address in addresses:
+        key = (
+            normalize_building_number(address["buildingNumber"]),
+            normalize_text(address.get("name")),
+        )
+        index.setdefault(key, address["id"])
+    return index
+
+
+def normalize_text(value: str | None) -> str:
     """Return a normalized representation for matching."""
     if value is None:
         return ""
-    return value.casefold().strip()
+    return _normalize_cached_text(value)
 
 
-def _normalize_building_number(value: str | None) -> str:
+def normalize_building_number(value: str | None) -> str:
     """Return a normalized building number."""
-    return _normalize_text(value).replace(" ", "")
+    if value is None:
+        return ""
+    return _normalize_cached_building_number(value)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cached_text(value: str) -> str:
+    """Return the memoized normalized form of a string."""
+    return value.casefold().strip()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cached_building_number(value: str) -> str:
+    """Return the memoized normalized form of a building number."""
+    return _normalize_cached_text(value).replace(" ", "")
@@ -14,7 +14,6 @@ from homeassistant.config_entries import (
     ConfigFlowResult,
 )
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import (
     ProNaturaAddressPoint,
@@ -32,7 +31,7 @@ from .const import (
     DOMAIN,
 )
 from .models import ProNaturaRuntimeData
-from .util import format_address_label
+from .util import async_get_api_client, format_address_label
 
 LOGGER = logging.getLogger(__name__)
 
@@ -45,19 +44,20 @@ class ProNaturaConfigFlow(ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         """Initialize the config flow."""
-        self._client: ProNaturaApiClient | None = None
         self._streets: list[ProNaturaStreet] = []
+        self._streets_by_id: dict[str, ProNaturaStreet] = {}
         self._addresses: list[ProNaturaAddressPoint] = []
+        self._addresses_by_id: dict[str, ProNaturaAddressPoint] = {}
         self._street: ProNaturaStreet | None = None
         self._reconfigure_entry: ConfigEntry | None = None
+        # New entries must store current IDs, so cached lookups are only used
+        # right after a forced refresh has downloaded them again.
+        self._lookups_refreshed = False
 
     @property
     def client(self) -> ProNaturaApiClient:
-        """Return a lazily created API client."""
-        if self._client is None:
-            session = async_get_clientsession(self.hass)
-            self._client = ProNaturaApiClient(session)
-        return self._client
+        """Return the shared API client."""
+        return async_get_api_client(self.hass)
 
     async def async_step_reconfigure(
         self, user_input: dict[str, Any] | None = None
@@ -75,9 +75,7 @@ class ProNaturaConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             street_id: str = user_input[CONF_STREET_ID]
-            self._street = next(
-                (item for item in self._streets if item["id"] == street_id), None
-            )
+            self._street = self._streets_by_id.get(street_id)
             if self._street is None:
                 errors["base"] = "street_not_found"
             else:
@@ -85,7 +83,10 @@ class ProNaturaConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if not self._streets:
             try:
-                self._streets = await self.client.async_get_streets()
+                self._streets = await self.client.async_get_streets(
+                    use_cache=self._lookups_refreshed
+                )
+                self._streets_by_id = {item["id"]: item for item in self._streets}
             except ProNaturaApiError as err:
                 LOGGER.debug("Failed to fetch ProNatura streets: %s", err)
                 errors["base"] = "cannot_connect"
@@ -128,9 +129,7 @@ class ProNaturaConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             address_id: str = user_input[CONF_ADDRESS_ID]
-            address = next(
-                (item for item in self._addresses if item["id"] == address_id), None
-            )
+            address = self._addresses_by_id.get(address_id)
             if address is None:
                 errors["base"] = "address_not_found"
             else:
@@ -178,7 +177,9 @@ class ProNaturaConfigFlow(ConfigFlow, domain=DOMAIN):
                 self._addresses = await self.client.async_get_address_points(
                     self._street["id"],
                     street_name=self._street["street"],
+                    use_cache=self._lookups_refreshed,
                 )
+                self._addresses_by_id = {item["id"]: item for item in self._addresses}
             except ProNaturaApiError as err:
                 LOGGER.debug(
                     "Failed to fetch ProNatura address points for street %s: %s",
@@ -227,3 +228,4 @@ class ProNaturaConfigFlow(ConfigFlow, domain=DOMAIN):
         if runtime_data is None:
             return
         await runtime_data.coordinator.async_force_schedule_refresh()
+        self._lookups_refreshed = True
@@ -10,6 +10,8 @@ from homeassistant.const import Platform
 DOMAIN: Final = "pronatura"
 PLATFORMS: Final = [Platform.SENSOR]
 
+DATA_CLIENT: Final = "shared_client"
+
 BASE_API_URL: Final = "https://zs5cv4ng75.execute-api.eu-central-1.amazonaws.com/prod"
 
 CONF_ADDRESS_ID: Final = "address_id"
@@ -20,7 +22,11 @@ CONF_STREET_ID: Final = "street_id"
 CONF_STREET_NAME: Final = "street_name"
 
 API_TIMEOUT = 10
+API_RETRY_ATTEMPTS = 3
+API_RETRY_BACKOFF = 0.25
+API_RETRY_MAX_DELAY = 30
 UPDATE_INTERVAL = timedelta(days=1)
+LOOKUP_CACHE_TTL = UPDATE_INTERVAL * 2
 
 DEFAULT_ATTRIBUTION: Final = "Data provided by ProNatura"
 ATTRIBUTION_TRANSLATION_KEY: Final = f"component.{DOMAIN}.common.attribution"
@@ -39,6 +45,12 @@ MONTH_NAME_TO_NUMBER: Final = {
     "listopad": 11,
     "grudzień": 12,
 }
+# Also accepts title and upper case labels, so they match without casefolding.
+MONTH_LOOKUP: Final = {
+    variant: number
+    for name, number in MONTH_NAME_TO_NUMBER.items()
+    for variant in (name, name.title(), name.upper())
+}
 
 FRACTION_ICONS: Final = {
     "odpady zmieszane": "mdi:trash-can",
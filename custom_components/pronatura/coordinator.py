@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from calendar import monthrange
 from collections.abc import Mapping as CollectionsMapping
 from dataclasses import dataclass
-from datetime import date, datetime, tzinfo
+from datetime import MAXYEAR, MINYEAR, date, datetime, tzinfo
+from itertools import chain
 import logging
 from typing import Any
 
@@ -20,13 +22,17 @@ from .api import (
     ProNaturaApiError,
     ProNaturaStreetNotFoundError,
     ProNaturaTrashScheduleResponse,
+    normalize_building_number,
+    normalize_text,
 )
 from .const import (
     CONF_ADDRESS_NAME,
     CONF_BUILDING_NUMBER,
     CONF_BUILDING_TYPE,
+    CONF_STREET_ID,
     CONF_STREET_NAME,
     DOMAIN,
+    MONTH_LOOKUP,
     MONTH_NAME_TO_NUMBER,
     UPDATE_INTERVAL,
 )
@@ -35,8 +41,13 @@ from .util import format_address_label
 
 LOGGER = logging.getLogger(__name__)
 
+# (year, month, day) keys compared instead of building a date for every day.
+type _DateKey = tuple[int, int, int]
+_DATE_KEY_MIN: _DateKey = (date.min.year - 1, 1, 1)
+_DATE_KEY_MAX: _DateKey = (date.max.year + 1, 1, 1)
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, frozen=True)
 class ProNaturaAddressDetails:
     """Represents descriptive metadata for an address."""
 
@@ -58,14 +69,6 @@ class ProNaturaCollectionData:
     details: ProNaturaAddressDetails
 
 
-@dataclass(slots=True)
-class _FractionCollectionWindow:
-    """Tracks upcoming and most recent collection dates for a fraction."""
-
-    next_date: date | None = None
-    previous_date: date | None = None
-
-
 class ProNaturaDataUpdateCoordinator(DataUpdateCoordinator[ProNaturaCollectionData]):
     """Coordinator that keeps the collection schedule up to date."""
 
@@ -86,14 +89,18 @@ class ProNaturaDataUpdateCoordinator(DataUpdateCoordinator[ProNaturaCollectionDa
         )
         self._client = client
         self._entry = entry
-        self._street_name = entry.data.get(CONF_STREET_NAME, "")
-        self._building_number = entry.data.get(CONF_BUILDING_NUMBER)
-        self._address_name = entry.data.get(CONF_ADDRESS_NAME)
+        data = entry.data
+        street_name = data.get(CONF_STREET_NAME, "")
+        building_number = data.get(CONF_BUILDING_NUMBER)
+        address_name = data.get(CONF_ADDRESS_NAME)
+        self._street_id = data.get(CONF_STREET_ID)
+        # Lookup keys never change for an entry, so normalize them only once.
+        self._street_key = normalize_text(street_name)
+        self._building_key = normalize_building_number(building_number)
+        self._address_name_key = normalize_text(address_name)
         self._timezone = dt_util.get_time_zone(hass.config.time_zone) or dt_util.UTC
         self._address_label = entry.title or format_address_label(
-            entry.data.get(CONF_STREET_NAME, ""),
-            entry.data.get(CONF_BUILDING_NUMBER),
-            entry.data.get(CONF_ADDRESS_NAME),
+            street_name, building_number, address_name
         )
         self._issue_active = False
         self._issue_id = f"{entry.entry_id}_address_not_found"
@@ -119,7 +126,9 @@ class ProNaturaDataUpdateCoordinator(DataUpdateCoordinator[ProNaturaCollectionDa
         except ProNaturaApiError as err:
             raise UpdateFailed(err) from err
 
-        next_dates = _compute_next_collection_dates(schedule, self._timezone)
+        next_dates = _compute_next_collection_dates(
+            schedule, self._timezone, today=now.astimezone(self._timezone).date()
+        )
         details = _build_address_details(schedule, self._entry.data)
         self._clear_address_issue()
         return ProNaturaCollectionData(
@@ -171,9 +180,10 @@ class ProNaturaDataUpdateCoordinator(DataUpdateCoordinator[ProNaturaCollectionDa
         await self.async_request_refresh()
 
     async def async_force_schedule_refresh(self) -> None:
-        """Force an immediate API refresh, bypassing the daily cache."""
+        """Force an immediate API refresh, bypassing the daily and lookup caches."""
         self._schedule_cache = None
         self._schedule_cache_timestamp = None
+        self._client.invalidate_lookup_cache()
         await self.async_refresh()
 
     async def _async_get_or_fetch_schedule(
@@ -187,12 +197,15 @@ class ProNaturaDataUpdateCoordinator(DataUpdateCoordinator[ProNaturaCollectionDa
         )
 
         if should_refresh:
-            schedule = await self._client.async_get_trash_schedule_for_address(
-                street_name=self._street_name,
-                building_number=self._building_number,
-                address_name=self._address_name,
+            result = await self._client.async_get_trash_schedule_for_normalized_address(
+                street=self._street_key,
+                building_number=self._building_key,
+                address_name=self._address_name_key,
                 label=self._address_label,
+                street_id=self._street_id,
             )
+            # Keep the matched street id, so later prefetches skip renumbered ones.
+            schedule, self._street_id = result
             self._schedule_cache = schedule
             self._schedule_cache_timestamp = dt_util.utcnow()
             return schedule
@@ -206,74 +219,117 @@ class ProNaturaDataUpdateCoordinator(DataUpdateCoordinator[ProNaturaCollectionDa
 def _build_address_details(
     schedule: ProNaturaTrashScheduleResponse, entry_data: CollectionsMapping[str, Any]
 ) -> ProNaturaAddressDetails:
-    street = schedule.get("street") or entry_data.get(CONF_STREET_NAME, "")
-    building_number = schedule.get("buildingNumber") or entry_data.get(
-        CONF_BUILDING_NUMBER
-    )
-    address_name = schedule.get("name") or entry_data.get(CONF_ADDRESS_NAME)
-    area = schedule.get("area")
-    building_type = schedule.get("buildingType") or entry_data.get(CONF_BUILDING_TYPE)
-    city = schedule.get("city")
+    """Return address metadata, falling back to the config entry data."""
+    get = schedule.get
+    fallback = entry_data.get
+    street = get("street") or fallback(CONF_STREET_NAME, "")
+    building_number = get("buildingNumber") or fallback(CONF_BUILDING_NUMBER)
+    address_name = get("name") or fallback(CONF_ADDRESS_NAME)
 
-    full_address = format_address_label(street, building_number, address_name)
     return ProNaturaAddressDetails(
-        street=street.title(),
-        building_number=building_number,
-        address_name=address_name,
-        area=area,
-        building_type=building_type,
-        city=city,
-        full_address=full_address,
+        street.title(),
+        building_number,
+        address_name,
+        get("area"),
+        get("buildingType") or fallback(CONF_BUILDING_TYPE),
+        get("city"),
+        format_address_label(street, building_number, address_name),
     )
 
 
 def _compute_next_collection_dates(
-    schedule: ProNaturaTrashScheduleResponse, timezone: tzinfo
+    schedule: ProNaturaTrashScheduleResponse,
+    timezone: tzinfo,
+    *,
+    today: date | None = None,
 ) -> dict[str, date | None]:
-    """Return the next collection date for each fraction."""
-    today = dt_util.now(timezone).date()
-    schedule_year = schedule.get("year", today.year)
+    """Return the next collection date for each fraction.
 
-    fractions: dict[str, _FractionCollectionWindow] = {}
+    `today` defaults to the current date in `timezone`.
+    """
+    if today is None:
+        today = dt_util.now(timezone).date()
+    schedule_year = schedule.get("year", today.year)
+    valid_year = isinstance(schedule_year, int) and MINYEAR <= schedule_year <= MAXYEAR
+    if not valid_year:
+        LOGGER.debug("Ignoring ProNatura schedule with invalid year: %r", schedule_year)
+    today_key = (today.year, today.month, today.day)
+    current_month = (today.year, today.month)
+
+    # Insertion-ordered set, so fractions without any valid day still get a sensor.
+    fractions: dict[str, None] = {}
+    next_dates: dict[str, _DateKey] = {}
+    previous_dates: dict[str, _DateKey] = {}
     unknown_month_labels: set[str] = set()
     invalid_day_entries: list[str] = []
+    upcoming: list[tuple[str, str, int, int, list[str]]] = []
+    past: list[tuple[str, str, int, int, list[str]]] = []
+    month_lookup = MONTH_LOOKUP.get
+    folded_month_lookup = MONTH_NAME_TO_NUMBER.get
     for month_info in schedule.get("trashSchedule", []):
-        month_label = (month_info.get("month") or "").casefold()
-        if (month_number := MONTH_NAME_TO_NUMBER.get(month_label)) is None:
+        month_label = month_info.get("month") or ""
+        # Common casings are precomputed; only fold labels that still miss.
+        month_number = month_lookup(month_label) or folded_month_lookup(
+            month_label.casefold()
+        )
+        if month_number is None:
             if month_label:
                 unknown_month_labels.add(month_label)
             else:
                 unknown_month_labels.add("<missing>")
             continue
 
+        if valid_year:
+            bucket = (
+                past if (schedule_year, month_number) < current_month else upcoming
+            )
+            month_length = monthrange(schedule_year, month_number)[1]
+        else:
+            # Without a usable year no day can be turned into a date.
+            bucket, month_length = upcoming, 0
         for fraction in month_info.get("schedule", []):
             fraction_name = fraction.get("type")
             if not fraction_name:
                 continue
-            tracker = fractions.setdefault(
-                fraction_name,
-                _FractionCollectionWindow(),
+            fractions[fraction_name] = None
+            bucket.append(
+                (
+                    fraction_name,
+                    month_label,
+                    month_number,
+                    month_length,
+                    fraction.get("days", []),
+                )
             )
 
-            for day_str in fraction.get("days", []):
-                try:
-                    day_int = int(day_str)
-                    candidate = date(schedule_year, month_number, day_int)
-                except (ValueError, TypeError):
-                    invalid_day_entries.append(
-                        f"{fraction_name}/{month_label or '?'}={day_str}"
-                    )
-                    continue
-
-                if candidate < today:
-                    previous_best = tracker.previous_date
-                    if previous_best is None or candidate > previous_best:
-                        tracker.previous_date = candidate
-                    continue
-
-                next_best = tracker.next_date
-                if next_best is None or candidate < next_best:
-                    tracker.next_date = candidate
+    # Bound methods are kept in locals on purpose; the loop below runs for
+    # every day of every fraction and would otherwise repeat attribute lookups.
+    next_get = next_dates.get
+    previous_get = previous_dates.get
+    report_invalid = invalid_day_entries.append
+
+    # Past months only provide a fallback date, so they are visited just for
+    # fractions that got no upcoming date. The filter runs lazily, after all
+    # upcoming months have been consumed.
+    for fraction_name, month_label, month_number, month_length, days in chain(
+        upcoming, (entry for entry in past if entry[0] not in next_dates)
+    ):
+        for day_str in days:
+            if type(day_str) is int:
+                day_int = day_str
+            else:
+                day_text = day_str.strip() if isinstance(day_str, str) else ""
+                day_int = int(day_text) if day_text.isdecimal() else 0
+            if not 1 <= day_int <= month_length:
+                report_invalid(f"{fraction_name}/{month_label or '?'}={day_str}")
+                continue
+
+            candidate = (schedule_year, month_number, day_int)
+            if candidate < today_key:
+                if candidate > previous_get(fraction_name, _DATE_KEY_MIN):
+                    previous_dates[fraction_name] = candidate
+            elif candidate < next_get(fraction_name, _DATE_KEY_MAX):
+                next_dates[fraction_name] = candidate
 
     if unknown_month_labels:
         LOGGER.debug(
@@ -286,7 +342,9 @@ def _compute_next_collection_dates(
             ", ".join(invalid_day_entries),
         )
 
-    return {
-        fraction_name: tracker.next_date or tracker.previous_date
-        for fraction_name, tracker in fractions.items()
-    }
+    # Sorted once here, so platforms can create entities in a stable order.
+    result: dict[str, date | None] = {}
+    for fraction_name in sorted(fractions):
+        key = next_dates.get(fraction_name) or previous_dates.get(fraction_name)
+        result[fraction_name] = date(*key) if key else None
+    return result
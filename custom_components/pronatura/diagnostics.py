@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from datetime import date
 from typing import Any
 
@@ -17,34 +18,40 @@ from .const import (
 )
 from .models import ProNaturaConfigEntry
 
-ENTRY_REDACT_KEYS = {
-    CONF_ADDRESS_ID,
-    CONF_STREET_NAME,
-    CONF_BUILDING_NUMBER,
-    CONF_ADDRESS_NAME,
-    CONF_BUILDING_TYPE,
-}
+ENTRY_REDACT_KEYS: frozenset[str] = frozenset(
+    {
+        CONF_ADDRESS_ID,
+        CONF_STREET_NAME,
+        CONF_BUILDING_NUMBER,
+        CONF_ADDRESS_NAME,
+        CONF_BUILDING_TYPE,
+    }
+)
 
-DETAILS_REDACT_KEYS = {
-    "full_address",
-    "street",
-    "building_number",
-    "address_name",
-    "area",
-    "building_type",
-    "city",
-}
+DETAILS_REDACT_KEYS: frozenset[str] = frozenset(
+    {
+        "full_address",
+        "street",
+        "building_number",
+        "address_name",
+        "area",
+        "building_type",
+        "city",
+    }
+)
 
-SCHEDULE_REDACT_KEYS = {
-    "id",
-    "street",
-    "buildingNumber",
-    "name",
-    "area",
-    "city",
-    "buildingType",
-    CONF_ADDRESS_ID,
-}
+SCHEDULE_REDACT_KEYS: frozenset[str] = frozenset(
+    {
+        "id",
+        "street",
+        "buildingNumber",
+        "name",
+        "area",
+        "city",
+        "buildingType",
+        CONF_ADDRESS_ID,
+    }
+)
 
 
 async def async_get_config_entry_diagnostics(
@@ -57,38 +64,36 @@ async def async_get_config_entry_diagnostics(
     data = coordinator.data
 
     entry_data = async_redact_data(entry.data, ENTRY_REDACT_KEYS)
-    details_payload = (
-        async_redact_data(_serialize_details(data.details), DETAILS_REDACT_KEYS)
-        if data
-        else None
-    )
-    raw_schedule = (
-        async_redact_data(data.raw_schedule, SCHEDULE_REDACT_KEYS) if data else None
-    )
-
-    return {
-        "entry_data": entry_data,
-        "address_details": details_payload,
-        "next_dates": _serialize_dates(data.next_dates) if data else {},
-        "raw_schedule": raw_schedule,
-    }
+    if data is None:
+        return {
+            "entry_data": entry_data,
+            "last_update_success": coordinator.last_update_success,
+            "address_details": None,
+            "next_dates": {},
+            "raw_schedule": None,
+        }
 
+    # Coordinator data is replaced on every refresh, so its identity keys the cache.
+    if (cached := runtime.diagnostics_cache) is None or cached[0] is not data:
+        isoformat = date.isoformat
+        cached = runtime.diagnostics_cache = (
+            data,
+            {
+                "address_details": async_redact_data(
+                    asdict(data.details), DETAILS_REDACT_KEYS
+                ),
+                "next_dates": {
+                    fraction: None if value is None else isoformat(value)
+                    for fraction, value in data.next_dates.items()
+                },
+                "raw_schedule": async_redact_data(
+                    data.raw_schedule, SCHEDULE_REDACT_KEYS
+                ),
+            },
+        )
 
-def _serialize_dates(source: dict[str, date | None]) -> dict[str, str | None]:
-    """Convert dates to ISO strings."""
     return {
-        fraction: value.isoformat() if value else None for fraction, value in source.items()
-    }
-
-
-def _serialize_details(details) -> dict[str, Any]:
-    """Serialize address metadata."""
-    return {
-        "full_address": details.full_address,
-        "street": details.street,
-        "building_number": details.building_number,
-        "address_name": details.address_name,
-        "area": details.area,
-        "building_type": details.building_type,
-        "city": details.city,
+        "entry_data": entry_data,
+        "last_update_success": coordinator.last_update_success,
+        **cached[1],
     }
@@ -6,16 +6,7 @@ from homeassistant.helpers import translation as translation_helper
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import (
-    ATTRIBUTION_TRANSLATION_KEY,
-    CONF_ADDRESS_ID,
-    CONF_ADDRESS_NAME,
-    CONF_BUILDING_NUMBER,
-    CONF_BUILDING_TYPE,
-    CONF_STREET_NAME,
-    DEFAULT_ATTRIBUTION,
-    DOMAIN,
-)
+from .const import ATTRIBUTION_TRANSLATION_KEY, DEFAULT_ATTRIBUTION, DOMAIN
 from .coordinator import ProNaturaAddressDetails, ProNaturaDataUpdateCoordinator
 from .models import ProNaturaConfigEntry
 from .util import format_address_label
@@ -24,6 +15,14 @@ from .util import format_address_label
 class ProNaturaEntity(CoordinatorEntity[ProNaturaDataUpdateCoordinator]):
     """Common entity behavior."""
 
+    __slots__ = (
+        "entry",
+        "_defaults",
+        "_address_id",
+        "_cached_device_info",
+        "_cached_device_details",
+    )
+
     _attr_attribution = DEFAULT_ATTRIBUTION
     _attr_has_entity_name = True
 
@@ -36,38 +35,50 @@ class ProNaturaEntity(CoordinatorEntity[ProNaturaDataUpdateCoordinator]):
         """Initialize the entity."""
         super().__init__(coordinator)
         self.entry = entry
-        self._address_id = entry.data[CONF_ADDRESS_ID]
-        self._address_name = entry.data.get(CONF_ADDRESS_NAME)
-        self._building_type = entry.data.get(CONF_BUILDING_TYPE)
-        self._street = entry.data.get(CONF_STREET_NAME, "")
-        self._building_number = entry.data.get(CONF_BUILDING_NUMBER)
+        self._defaults = entry.runtime_data.defaults
+        self._address_id = self._defaults.address_id
+        self._cached_device_info: DeviceInfo | None = None
+        self._cached_device_details: ProNaturaAddressDetails | None = None
 
     async def async_added_to_hass(self) -> None:
         """Update translated fields after the entity is added."""
         await super().async_added_to_hass()
-        translations = translation_helper.async_get_cached_translations(
-            self.hass,
-            self.hass.config.language,
-            "component",
-            DOMAIN,
-        )
-        self._attr_attribution = translations.get(
-            ATTRIBUTION_TRANSLATION_KEY,
-            DEFAULT_ATTRIBUTION,
-        )
+        runtime_data = self.entry.runtime_data
+        if (attribution := runtime_data.attribution) is None:
+            translations = translation_helper.async_get_cached_translations(
+                self.hass,
+                self.hass.config.language,
+                "component",
+                DOMAIN,
+            )
+            attribution = runtime_data.attribution = translations.get(
+                ATTRIBUTION_TRANSLATION_KEY,
+                DEFAULT_ATTRIBUTION,
+            )
+        self._attr_attribution = attribution
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return the device info for the entity."""
         details = self._coordinator_details()
+        # Coordinator details are replaced on every refresh, never mutated.
+        if (
+            self._cached_device_info is not None
+            and self._cached_device_details is details
+        ):
+            return self._cached_device_info
 
-        name = format_address_label(
-            details.street if details else self._street,
-            details.building_number if details else self._building_number,
-            (details.address_name if details else None) or self._address_name,
-        )
+        if details is not None:
+            name = details.full_address
+        else:
+            defaults = self._defaults
+            name = format_address_label(
+                defaults.street, defaults.building_number, defaults.address_name
+            )
         model_parts = [name]
-        building_type = details.building_type if details else self._building_type
+        building_type = (
+            details.building_type if details else self._defaults.building_type
+        )
         if building_type:
             model_parts.append(str(building_type))
         area = details.area if details else None
@@ -75,13 +86,15 @@ class ProNaturaEntity(CoordinatorEntity[ProNaturaDataUpdateCoordinator]):
             model_parts.append(f"strefa: {area}")
         model = ", ".join(model_parts)
 
-        return DeviceInfo(
+        self._cached_device_details = details
+        self._cached_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._address_id)},
             name=name,
             model=model,
             manufacturer="ProNatura",
             entry_type=DeviceEntryType.SERVICE,
         )
+        return self._cached_device_info
 
     def _coordinator_details(self) -> ProNaturaAddressDetails | None:
         """Return address details from the coordinator if available."""
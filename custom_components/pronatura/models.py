@@ -2,15 +2,45 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 
 from .api import ProNaturaApiClient
+from .const import (
+    CONF_ADDRESS_ID,
+    CONF_ADDRESS_NAME,
+    CONF_BUILDING_NUMBER,
+    CONF_BUILDING_TYPE,
+    CONF_STREET_NAME,
+)
 
 if TYPE_CHECKING:
-    from .coordinator import ProNaturaDataUpdateCoordinator
+    from .coordinator import ProNaturaCollectionData, ProNaturaDataUpdateCoordinator
+
+
+@dataclass(slots=True, frozen=True)
+class ProNaturaAddressDefaults:
+    """Address fields from the config entry, shared by all entities of an entry."""
+
+    address_id: str
+    street: str
+    building_number: str | None
+    address_name: str | None
+    building_type: str | None
+
+    @classmethod
+    def from_entry_data(cls, data: Mapping[str, Any]) -> ProNaturaAddressDefaults:
+        """Read the address fields from config entry data."""
+        return cls(
+            address_id=data[CONF_ADDRESS_ID],
+            street=data.get(CONF_STREET_NAME, ""),
+            building_number=data.get(CONF_BUILDING_NUMBER),
+            address_name=data.get(CONF_ADDRESS_NAME),
+            building_type=data.get(CONF_BUILDING_TYPE),
+        )
 
 
 @dataclass(slots=True)
@@ -19,6 +49,9 @@ class ProNaturaRuntimeData:
 
     client: ProNaturaApiClient
     coordinator: ProNaturaDataUpdateCoordinator
+    defaults: ProNaturaAddressDefaults
+    attribution: str | None = None
+    diagnostics_cache: tuple[ProNaturaCollectionData, dict[str, Any]] | None = None
 
 
 type ProNaturaConfigEntry = ConfigEntry[ProNaturaRuntimeData]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+from typing import Any
 
 import voluptuous as vol
 
@@ -11,6 +11,10 @@ from homeassistant.components.repairs import ConfirmRepairFlow, RepairsFlow
 from homeassistant.config_entries import SOURCE_RECONFIGURE
 from homeassistant.core import HomeAssistant
 
+from .models import ProNaturaConfigEntry
+
+_EMPTY_SCHEMA = vol.Schema({})
+
 
 class _AddressRepairFlow(RepairsFlow):
     """Repair flow that launches the reconfigure config flow."""
@@ -18,11 +22,15 @@ class _AddressRepairFlow(RepairsFlow):
     def __init__(self, entry_id: str) -> None:
         """Store the entry identifier."""
         self._entry_id = entry_id
+        self._entry_ref: ProNaturaConfigEntry | None = None
         super().__init__()
 
     @property
-    def _entry(self):
-        return self.hass.config_entries.async_get_entry(self._entry_id)
+    def _entry(self) -> ProNaturaConfigEntry | None:
+        """Return the config entry, resolving it once per flow."""
+        if self._entry_ref is None:
+            self._entry_ref = self.hass.config_entries.async_get_entry(self._entry_id)
+        return self._entry_ref
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -45,13 +53,15 @@ class _AddressRepairFlow(RepairsFlow):
                     "source": SOURCE_RECONFIGURE,
                     "entry_id": entry.entry_id,
                 },
-                data=cast(dict[str, Any], entry.data),
+                # Flows only read their init data, so the read-only mapping is passed
+                # as-is instead of being copied.
+                data=entry.data,
             )
             return self.async_create_entry(data={})
 
         return self.async_show_form(
             step_id="confirm",
-            data_schema=vol.Schema({}),
+            data_schema=_EMPTY_SCHEMA,
             description_placeholders={"title": entry.title},
         )
 
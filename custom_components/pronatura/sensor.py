@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.core import HomeAssistant
@@ -13,6 +14,8 @@ from .coordinator import ProNaturaAddressDetails, ProNaturaDataUpdateCoordinator
 from .entity import ProNaturaEntity
 from .models import ProNaturaConfigEntry
 
+_SLUG_TABLE = str.maketrans({" ": "_", "-": "_"})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,23 +27,23 @@ async def async_setup_entry(
     assert runtime_data is not None
     coordinator = runtime_data.coordinator
 
-    if coordinator.data is None:
+    if (data := coordinator.data) is None:
         return
 
+    sensor_cls = ProNaturaCollectionSensor
     entities = [
-        ProNaturaCollectionSensor(
-            coordinator=coordinator,
-            entry=entry,
-            fraction=fraction,
-        )
-        for fraction in sorted(coordinator.data.next_dates)
+        sensor_cls(coordinator=coordinator, entry=entry, fraction=fraction)
+        for fraction in data.next_dates
     ]
-    async_add_entities(entities)
+    # The coordinator has already refreshed, so there is nothing to update.
+    async_add_entities(entities, update_before_add=False)
 
 
 class ProNaturaCollectionSensor(ProNaturaEntity, SensorEntity):
     """Sensor exposing the next collection date for a fraction."""
 
+    __slots__ = ("_fraction", "_fraction_slug", "_attrs_cache", "_attrs_details")
+
     _attr_device_class = SensorDeviceClass.DATE
 
     def __init__(
@@ -56,25 +59,28 @@ class ProNaturaCollectionSensor(ProNaturaEntity, SensorEntity):
         self._fraction_slug = _slugify(fraction)
         self._attr_name = fraction.title()
         self._attr_unique_id = f"{self._address_id}-{self._fraction_slug}"
-        self._attr_icon = FRACTION_ICONS.get(fraction, "mdi:trash-can-outline")
+        self._attr_icon = _fraction_icon(fraction)
+        self._attrs_cache: dict[str, str | None] | None = None
+        self._attrs_details: ProNaturaAddressDetails | None = None
 
     @property
     def native_value(self) -> date | None:
         """Return the next collection date."""
-        data = self.coordinator.data
-        if data is None:
-            return None
-        return data.next_dates.get(self._fraction)
+        return self.coordinator.data.next_dates.get(self._fraction)
 
     @property
-    def extra_state_attributes(self) -> dict[str, str | None] | None:
+    def extra_state_attributes(self) -> dict[str, str | None]:
         """Return additional metadata for the address."""
-        if (coordinator_data := self.coordinator.data) is None:
-            return None
-        details: ProNaturaAddressDetails = coordinator_data.details
-        full_address = " ".join(
-            part for part in (details.street, details.building_number) if part
-        )
+        details: ProNaturaAddressDetails = self.coordinator.data.details
+        # Coordinator details are replaced on every refresh, never mutated.
+        if self._attrs_cache is not None and self._attrs_details is details:
+            return self._attrs_cache
+
+        street, building_number = details.street, details.building_number
+        if street and building_number:
+            full_address = f"{street} {building_number}"
+        else:
+            full_address = street or building_number or ""
         attrs: dict[str, str | None] = {
             "full_address": full_address,
             "fraction_name": self._fraction,
@@ -83,9 +89,18 @@ class ProNaturaCollectionSensor(ProNaturaEntity, SensorEntity):
         }
         if details.address_name:
             attrs["address_name"] = details.address_name
+        self._attrs_details = details
+        self._attrs_cache = attrs
         return attrs
 
 
+@lru_cache(maxsize=128)
 def _slugify(value: str) -> str:
     """Return a slug for the given string."""
-    return value.casefold().replace(" ", "_").replace("-", "_")
+    return value.casefold().translate(_SLUG_TABLE)
+
+
+@lru_cache(maxsize=128)
+def _fraction_icon(fraction: str) -> str:
+    """Return the icon for a fraction, with a generic fallback."""
+    return FRACTION_ICONS.get(fraction, "mdi:trash-can-outline")
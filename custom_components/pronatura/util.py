@@ -2,6 +2,29 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .api import ProNaturaApiClient
+from .const import DATA_CLIENT, DOMAIN
+
+
+@callback
+def async_get_api_client(hass: HomeAssistant) -> ProNaturaApiClient:
+    """Return the API client shared by config entries and flows.
+
+    The client wraps Home Assistant's shared `ClientSession`, so connections are
+    pooled and kept alive, and its lookup caches are reused across entries.
+    """
+    domain_data: dict[str, ProNaturaApiClient] = hass.data.setdefault(DOMAIN, {})
+    if (client := domain_data.get(DATA_CLIENT)) is None:
+        client = domain_data[DATA_CLIENT] = ProNaturaApiClient(
+            async_get_clientsession(hass)
+        )
+    return client
+
 
 def format_address_label(
     street: str,
@@ -9,8 +32,14 @@ def format_address_label(
     name: str | None = None,
 ) -> str:
     """Return a nicely formatted address display label."""
-    street_clean = (street or "").title()
+    street_clean = _title(street or "")
     base = f"{street_clean} {building or ''}".strip()
     if name:
         return f"{base} ({name})"
     return base
+
+
+@lru_cache(maxsize=256)
+def _title(value: str) -> str:
+    """Return the memoized title-cased form of a street name."""
+    return value.title()